@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Optional
-import zoneinfo
 
 import numpy as np
 import pandas as pd
@@ -24,6 +25,18 @@ _RANGE_CONFIG: dict[str, tuple[int, str, str]] = {
 
 _HRV_COLS = ["rmssd", "sdnn", "mean_hr", "lf_hf_ratio"]
 
+# Pipeline stages hold only configuration, so one instance serves all requests
+_PROCESSOR = HRVProcessor()
+_EXTRACTOR = HRVFeatureExtractor()
+_WEEKLY = WeeklyAnalyzer()
+
+# Full responses are cached per (user_id, range, TTL bucket of now). HRV windows
+# are 15 min wide, so a few minutes of staleness is not observable
+_RESPONSE_CACHE_TTL_S = 300
+_RESPONSE_CACHE_SIZE = 1024
+_response_cache: OrderedDict[tuple, dict] = OrderedDict()
+_response_cache_lock = threading.Lock()
+
 
 def _safe_float(val) -> Optional[float]:
     """Convert numpy scalar or NaN to Python float or None."""
@@ -36,16 +49,46 @@ def _safe_float(val) -> Optional[float]:
         return None
 
 
-def compute_hrv_for_range(user_id: str, range: str) -> dict:
-    days, freq, label_fmt = _RANGE_CONFIG[range]
+def _safe_float_list(col: pd.Series) -> list[Optional[float]]:
+    """Convert a numeric column to Python floats in one pass, mapping NaN to None."""
+    return [None if v != v else v for v in col.to_numpy(dtype=np.float64).tolist()]
 
-    user_tz = zoneinfo.ZoneInfo(TZ)
 
-    # Compute lookback start in user TZ, then convert to UTC for DB query
+def invalidate_hrv_cache(user_id: Optional[str] = None) -> None:
+    """Drop cached responses for one user (e.g. after new samples are ingested), or all."""
+    with _response_cache_lock:
+        if user_id is None:
+            _response_cache.clear()
+            return
+        for key in [k for k in _response_cache if k[0] == user_id]:
+            del _response_cache[key]
+
+
+def compute_hrv_for_range(user_id: str, range: str) -> dict:
     now_utc = datetime.now(timezone.utc)
-    now_local = now_utc.astimezone(user_tz)
-    start_local = now_local - timedelta(days=days)
-    start_utc = start_local.astimezone(timezone.utc)
+    key = (user_id, range, int(now_utc.timestamp()) // _RESPONSE_CACHE_TTL_S)
+
+    with _response_cache_lock:
+        cached = _response_cache.get(key)
+        if cached is not None:
+            _response_cache.move_to_end(key)
+            return cached
+
+    result = _compute_hrv_for_range(user_id, range, now_utc)
+
+    with _response_cache_lock:
+        _response_cache[key] = result
+        while len(_response_cache) > _RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+    return result
+
+
+def _compute_hrv_for_range(user_id: str, range: str, now_utc: datetime) -> dict:
+    days, freq, label_fmt = _RANGE_CONFIG[range]
+
+    # Lookback start in UTC for DB query; a DST shift inside the window moves
+    # this by at most an hour, which is irrelevant for multi-day lookbacks
+    start_utc = now_utc - timedelta(days=days)
 
     # Step 1: Fetch raw heart rate data (timestamps returned as TZ-aware)
     df_raw = get_heart_rate_data(user_id, start_utc)
@@ -53,12 +96,12 @@ def compute_hrv_for_range(user_id: str, range: str) -> dict:
         raise HTTPException(status_code=404, detail="No heart rate data for selected range.")
 
     # Step 2: Window into 15-min IBI windows
-    df_windows = HRVProcessor().process(df_raw)
+    df_windows = _PROCESSOR.process(df_raw)
     if df_windows.empty:
         raise HTTPException(status_code=404, detail="No heart rate data for selected range.")
 
     # Step 3: Extract HRV features per window
-    df_hrv = HRVFeatureExtractor().process_windows(df_windows)
+    df_hrv = _EXTRACTOR.process_windows(df_windows)
     if df_hrv.empty:
         raise HTTPException(status_code=404, detail="No heart rate data for selected range.")
 
@@ -79,16 +122,19 @@ def compute_hrv_for_range(user_id: str, range: str) -> dict:
         .reset_index()
     )
 
-    # Step 5: Build time_series from resampled index
-    time_series = []
-    for _, row in agg_df.iterrows():
-        time_series.append({
-            "bucket":      row["timestamp"].strftime(label_fmt),
-            "rmssd":       _safe_float(row["rmssd"]),
-            "sdnn":        _safe_float(row["sdnn"]),
-            "mean_hr":     _safe_float(row["mean_hr"]),
-            "lf_hf_ratio": _safe_float(row["lf_hf_ratio"]),
-        })
+    # Step 5: Build time_series from resampled index (columns converted in bulk)
+    buckets = agg_df["timestamp"].dt.strftime(label_fmt).tolist()
+    time_series = [
+        {
+            "bucket":      bucket,
+            "rmssd":       rmssd,
+            "sdnn":        sdnn,
+            "mean_hr":     mean_hr,
+            "lf_hf_ratio": lf_hf_ratio,
+        }
+        for bucket, rmssd, sdnn, mean_hr, lf_hf_ratio
+        in zip(buckets, *(_safe_float_list(agg_df[c]) for c in _HRV_COLS))
+    ]
 
     # Step 6: Summary metrics from aggregated buckets
     summary = {
@@ -102,7 +148,7 @@ def compute_hrv_for_range(user_id: str, range: str) -> dict:
     patterns = None
     if range in ("7d", "30d", "6m"):
         df_hrv_reset = df_hrv.reset_index(drop=True)
-        patterns = WeeklyAnalyzer().create_weekly_summary(df_hrv_reset)
+        patterns = _WEEKLY.create_weekly_summary(df_hrv_reset)
 
     return {
         "user_id":         user_id,
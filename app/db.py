@@ -1,35 +1,61 @@
+import io
+
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine
 
 from app.config import DATABASE_URL, TZ
 
 engine = create_engine(DATABASE_URL)
 
-_SQL = text("""
-    SELECT start_time AT TIME ZONE 'UTC' AT TIME ZONE :tz AS start_time,
+# Streamed with COPY ... TO STDOUT so rows never become Python objects;
+# COPY cannot take bind parameters, so values are inlined via mogrify
+_SQL = """
+    SELECT start_time AT TIME ZONE 'UTC' AT TIME ZONE %(tz)s AS start_time,
            value
     FROM health_samples
-    WHERE user_id     = :user_id
+    WHERE user_id     = %(user_id)s
       AND sample_type = 'heart_rate'
-      AND start_time  >= :start_time
+      AND start_time  >= %(start_time)s
     ORDER BY start_time
-""")
+"""
+
+# Trailing UTC offset as rendered by Postgres for timestamptz values (e.g. "+00", "-04:00")
+_UTC_OFFSET_RE = r"[+-]\d{2}(?::?\d{2})?$"
 
 
 def get_heart_rate_data(user_id: str, start_time: datetime) -> pd.DataFrame:
-    with engine.connect() as conn:
-        df = pd.read_sql(
-            _SQL,
-            conn,
-            params={"user_id": user_id, "start_time": start_time, "tz": TZ},
+    conn = engine.raw_connection()
+    try:
+        with conn.cursor() as cur:
+            query = cur.mogrify(
+                _SQL,
+                {"user_id": user_id, "start_time": start_time, "tz": TZ},
+            ).decode()
+            buf = io.StringIO()
+            cur.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT csv)", buf)
+    finally:
+        conn.close()
+
+    buf.seek(0)
+    try:
+        df = pd.read_csv(
+            buf,
+            names=["timestamp", "bpm"],
+            dtype={"timestamp": str, "bpm": np.float64},
         )
-    df = df.rename(columns={"start_time": "timestamp", "value": "bpm"})
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
+    except pd.errors.EmptyDataError:
+        df = pd.DataFrame({
+            "timestamp": pd.Series(dtype=str),
+            "bpm":       pd.Series(dtype=np.float64),
+        })
+
+    has_offset = bool(df["timestamp"].iloc[:1].str.contains(_UTC_OFFSET_RE).any())
+    df["timestamp"] = pd.to_datetime(df["timestamp"], format="ISO8601", utc=has_offset)
 
     if df["timestamp"].dt.tz is None:
        df["timestamp"] = df["timestamp"].dt.tz_localize(TZ)
     else:
        df["timestamp"] = df["timestamp"].dt.tz_convert(TZ)
-       df["bpm"] = df["bpm"].astype(float)
     return df
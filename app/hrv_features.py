@@ -3,13 +3,140 @@ HRV Features Extraction Module
 Computes time-domain, frequency-domain, and non-linear HRV metrics
 """
 
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 from typing import Dict, List, Optional
+from numba import njit
 from hrvanalysis import remove_outliers, remove_ectopic_beats
 from hrvanalysis import get_time_domain_features, get_frequency_domain_features
 from hrvanalysis import get_poincare_plot_features
 
+# LRU of per-window features shared across requests; overlapping range/day
+# queries see the same 15-min windows, so identical IBI buffers recur
+_FEATURE_CACHE_SIZE = 4096
+_feature_cache: "OrderedDict[tuple, Dict]" = OrderedDict()
+_feature_cache_lock = threading.Lock()
+
+# Process pools are created once per worker count and reused across requests.
+# Workers are spawned, not forked, since requests run on server threads
+_PARALLEL_MIN_WINDOWS = 7 * 96  # a week of 15-min windows; day-sized batches stay in-process
+_process_pools: Dict[int, ProcessPoolExecutor] = {}
+_process_pools_lock = threading.Lock()
+
+# Windows shorter than this use the JIT time-domain kernel instead of hrvanalysis
+_NUMBA_TIME_DOMAIN_MAX_LEN = 512
+
+# Welch settings mirroring hrvanalysis.get_frequency_domain_features defaults
+_WELCH_FS = 4.0
+_WELCH_NFFT = 4096
+_WELCH_MAX_NPERSEG = 256  # longer signals span several Welch segments
+_WELCH_BATCH_SIZE = 256  # windows per batched FFT, bounds the (batch, nfft) buffer
+_VLF_BAND = (0.003, 0.04)
+_LF_BAND = (0.04, 0.15)
+_HF_BAND = (0.15, 0.40)
+
+
+@njit(cache=True, fastmath=True)
+def _time_domain_numba(rr: np.ndarray) -> tuple:
+    """
+    Compute hrvanalysis-equivalent time-domain metrics in fused loops
+    
+    Args:
+        rr: NaN-free float32 or float64 array of at least 2 NN intervals
+        
+    Returns:
+        Tuple of metrics in the key order of _empty_time_features
+    """
+    n = rr.shape[0]
+    
+    # Pass 1: sums, extrema and successive-difference accumulators
+    total = 0.0
+    hr_total = 0.0
+    lo = rr[0]
+    hi = rr[0]
+    diff_total = 0.0
+    diff_sq_total = 0.0
+    nni_50 = 0
+    nni_20 = 0
+    for i in range(n):
+        v = rr[i]
+        total += v
+        hr_total += 60000.0 / v
+        lo = min(lo, v)
+        hi = max(hi, v)
+        if i > 0:
+            d = v - rr[i - 1]
+            diff_total += d
+            diff_sq_total += d * d
+            if abs(d) > 50.0:
+                nni_50 += 1
+            if abs(d) > 20.0:
+                nni_20 += 1
+    mean_nni = total / n
+    mean_hr = hr_total / n
+    diff_mean = diff_total / (n - 1)
+    
+    # Pass 2: centred second moments
+    sq = 0.0
+    hr_sq = 0.0
+    diff_sq = 0.0
+    for i in range(n):
+        v = rr[i]
+        sq += (v - mean_nni) ** 2
+        hr_sq += (60000.0 / v - mean_hr) ** 2
+        if i > 0:
+            diff_sq += (v - rr[i - 1] - diff_mean) ** 2
+    
+    sdnn = np.sqrt(sq / (n - 1))
+    rmssd = np.sqrt(diff_sq_total / (n - 1))
+    return (
+        mean_nni,
+        sdnn,
+        np.sqrt(diff_sq / (n - 1)),
+        rmssd,
+        np.median(rr),
+        nni_50,
+        100.0 * nni_50 / (n - 1),
+        nni_20,
+        100.0 * nni_20 / (n - 1),
+        hi - lo,
+        rmssd / mean_nni,
+        sdnn / mean_nni,
+        mean_hr,
+        60000.0 / lo,
+        60000.0 / hi,
+        np.sqrt(hr_sq / n),
+    )
+
+
+def _get_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Return the shared spawn-context process pool for a worker count, creating it on first use"""
+    with _process_pools_lock:
+        pool = _process_pools.get(max_workers)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            _process_pools[max_workers] = pool
+        return pool
+
+
+def _discard_process_pool(max_workers: int, pool: ProcessPoolExecutor) -> None:
+    """Forget a broken pool so the next parallel batch starts a fresh one"""
+    with _process_pools_lock:
+        if _process_pools.get(max_workers) is pool:
+            del _process_pools[max_workers]
+    pool.shutdown(wait=False, cancel_futures=True)
+
 
 class HRVFeatureExtractor:
     """Extract HRV features from RR intervals"""
@@ -17,7 +144,9 @@ class HRVFeatureExtractor:
     def __init__(
         self, 
         remove_outliers_flag: bool = True,
-        ectopic_detection: str = "malik"
+        ectopic_detection: str = "malik",
+        max_workers: Optional[int] = None,
+        parallel_min_windows: int = _PARALLEL_MIN_WINDOWS
     ):
         """
         Initialize feature extractor
@@ -25,9 +154,13 @@ class HRVFeatureExtractor:
         Args:
             remove_outliers_flag: Whether to remove outliers
             ectopic_detection: Method for ectopic beat detection ('malik', 'karlsson', 'kamath')
+            max_workers: Worker processes for feature extraction (defaults to CPU count)
+            parallel_min_windows: Minimum number of windows before a process pool is used
         """
         self.remove_outliers_flag = remove_outliers_flag
         self.ectopic_detection = ectopic_detection
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.parallel_min_windows = parallel_min_windows
     
     def clean_rr_intervals(self, rr_intervals: List[float]) -> List[float]:
         """
@@ -42,7 +175,8 @@ class HRVFeatureExtractor:
         if len(rr_intervals) < 10:
             return rr_intervals
         
-        rr_clean = rr_intervals.copy()
+        # hrvanalysis expects a list of float64 values
+        rr_clean = np.asarray(rr_intervals, dtype=np.float64).tolist()
         
         # Remove outliers
         if self.remove_outliers_flag:
@@ -75,6 +209,12 @@ class HRVFeatureExtractor:
             return self._empty_time_features()
         
         try:
+            rr = np.asarray(rr_intervals)
+            # Short, NaN-free windows go through the JIT kernel (float32 buffers are
+            # consumed as-is); anything else keeps hrvanalysis' exact NaN semantics
+            if len(rr) < _NUMBA_TIME_DOMAIN_MAX_LEN and np.isfinite(rr).all():
+                values = _time_domain_numba(rr)
+                return dict(zip(self._empty_time_features(), values))
             features = get_time_domain_features(rr_intervals)
             return features
         except Exception as e:
@@ -101,6 +241,75 @@ class HRVFeatureExtractor:
             print(f"Error extracting frequency features: {e}")
             return self._empty_frequency_features()
     
+    def extract_frequency_domain_batch(self, rr_batch: List[List[float]]) -> List[Dict]:
+        """
+        Extract frequency-domain HRV features for many windows at once
+        
+        Windows whose 4 Hz resampled signal fits in a single Welch segment are
+        stacked and transformed with one batched FFT, which is equivalent to
+        hrvanalysis' per-window Welch call; all other windows use
+        extract_frequency_domain.
+        
+        Args:
+            rr_batch: Cleaned RR intervals, one list per window
+            
+        Returns:
+            List of frequency-domain metric dictionaries in input order
+        """
+        results: List[Optional[Dict]] = [None] * len(rr_batch)
+        batch_idx = []
+        batch_signals = []
+        for i, rr_intervals in enumerate(rr_batch):
+            signal = self._welch_input_signal(rr_intervals)
+            if signal is None:
+                results[i] = self.extract_frequency_domain(rr_intervals)
+            else:
+                batch_idx.append(i)
+                batch_signals.append(signal)
+        
+        freq = np.fft.rfftfreq(_WELCH_NFFT, d=1 / _WELCH_FS)
+        vlf_mask = (freq >= _VLF_BAND[0]) & (freq < _VLF_BAND[1])
+        lf_mask = (freq >= _LF_BAND[0]) & (freq < _LF_BAND[1])
+        hf_mask = (freq >= _HF_BAND[0]) & (freq < _HF_BAND[1])
+        
+        for start in range(0, len(batch_signals), _WELCH_BATCH_SIZE):
+            signals = batch_signals[start:start + _WELCH_BATCH_SIZE]
+            
+            # Hann-windowed, zero-padded signals; each row is one Welch segment
+            stack = np.zeros((len(signals), _WELCH_NFFT))
+            scale = np.empty(len(signals))
+            for row, signal in enumerate(signals):
+                n = len(signal)
+                window = np.hanning(n + 1)[:-1]  # periodic Hann, as scipy's 'hann'
+                stack[row, :n] = (signal - signal.mean()) * window
+                scale[row] = 1.0 / (_WELCH_FS * np.sum(window ** 2))
+            
+            # One-sided power spectral density
+            psd = np.abs(np.fft.rfft(stack, axis=1)) ** 2 * scale[:, None]
+            psd[:, 1:-1] *= 2
+            
+            vlf = np.trapz(psd[:, vlf_mask], freq[vlf_mask], axis=1)
+            lf = np.trapz(psd[:, lf_mask], freq[lf_mask], axis=1)
+            hf = np.trapz(psd[:, hf_mask], freq[hf_mask], axis=1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                lf_hf_ratio = lf / hf
+                lfnu = lf / (lf + hf) * 100
+                hfnu = hf / (lf + hf) * 100
+            total_power = vlf + lf + hf
+            
+            for row, i in enumerate(batch_idx[start:start + _WELCH_BATCH_SIZE]):
+                results[i] = {
+                    'lf': lf[row],
+                    'hf': hf[row],
+                    'lf_hf_ratio': lf_hf_ratio[row],
+                    'lfnu': lfnu[row],
+                    'hfnu': hfnu[row],
+                    'total_power': total_power[row],
+                    'vlf': vlf[row]
+                }
+        
+        return results
+    
     def extract_nonlinear(self, rr_intervals: List[float]) -> Dict:
         """
         Extract non-linear HRV features (Poincaré plot)
@@ -131,24 +340,40 @@ class HRVFeatureExtractor:
         Returns:
             Dictionary containing all HRV metrics
         """
+        return self.extract_all_features_batch([rr_intervals])[0]
+    
+    def extract_all_features_batch(self, rr_batch: List[List[float]]) -> List[Dict]:
+        """
+        Extract all HRV features for many windows, batching the spectral step
+        
+        Args:
+            rr_batch: RR intervals in milliseconds, one list per window
+            
+        Returns:
+            List of dictionaries containing all HRV metrics, in input order
+        """
         # Clean RR intervals
-        rr_clean = self.clean_rr_intervals(rr_intervals)
-        
-        # Extract features
-        time_features = self.extract_time_domain(rr_clean)
-        freq_features = self.extract_frequency_domain(rr_clean)
-        nonlinear_features = self.extract_nonlinear(rr_clean)
-        
-        # Combine all features
-        all_features = {
-            **time_features,
-            **freq_features,
-            **nonlinear_features,
-            'num_rr_intervals': len(rr_clean),
-            'num_removed': len(rr_intervals) - len(rr_clean)
-        }
+        rr_clean_batch = [self.clean_rr_intervals(rr_intervals) for rr_intervals in rr_batch]
+        
+        # Frequency-domain features share one FFT pass across windows
+        freq_batch = self.extract_frequency_domain_batch(rr_clean_batch)
         
-        return all_features
+        results = []
+        for rr_intervals, rr_clean, freq_features in zip(rr_batch, rr_clean_batch, freq_batch):
+            # Extract features
+            time_features = self.extract_time_domain(rr_clean)
+            nonlinear_features = self.extract_nonlinear(rr_clean)
+            
+            # Combine all features
+            results.append({
+                **time_features,
+                **freq_features,
+                **nonlinear_features,
+                'num_rr_intervals': len(rr_clean),
+                'num_removed': len(rr_intervals) - len(rr_clean)
+            })
+        
+        return results
     
     def process_windows(self, df_windows: pd.DataFrame) -> pd.DataFrame:
         """
@@ -160,17 +385,33 @@ class HRVFeatureExtractor:
         Returns:
             DataFrame with HRV features for each window
         """
-        results = []
+        timestamps = df_windows['timestamp'].tolist()
+        ibi_lists = self._window_ibi_arrays(df_windows['ibi_ms'])
+        keys = [self._cache_key(ibi_list) for ibi_list in ibi_lists]
         
-        for idx, row in df_windows.iterrows():
-            timestamp = row['timestamp']
-            ibi_list = row['ibi_ms']
-            
-            # Extract features
-            features = self.extract_all_features(ibi_list)
+        # Serve previously seen windows from the cache
+        results: List[Optional[Dict]] = [None] * len(ibi_lists)
+        misses = []
+        with _feature_cache_lock:
+            for i, key in enumerate(keys):
+                cached = _feature_cache.get(key)
+                if cached is None:
+                    misses.append(i)
+                else:
+                    _feature_cache.move_to_end(key)
+                    results[i] = dict(cached)
+        
+        computed = self._extract_batch([ibi_lists[i] for i in misses])
+        
+        with _feature_cache_lock:
+            for i, features in zip(misses, computed):
+                _feature_cache[keys[i]] = dict(features)
+                results[i] = features
+            while len(_feature_cache) > _FEATURE_CACHE_SIZE:
+                _feature_cache.popitem(last=False)
+        
+        for features, timestamp in zip(results, timestamps):
             features['timestamp'] = timestamp
-            
-            results.append(features)
         
         df_hrv = pd.DataFrame(results)
         
@@ -180,6 +421,93 @@ class HRVFeatureExtractor:
         
         return df_hrv
     
+    def _extract_batch(self, ibi_lists: List[List[float]]) -> List[Dict]:
+        """
+        Extract features for a batch of windows, in parallel when worthwhile
+        
+        Args:
+            ibi_lists: IBI lists, one per window
+            
+        Returns:
+            List of feature dictionaries in input order
+        """
+        # Windows are independent, so large batches are spread across processes;
+        # smaller batches (1d queries, per-day range buckets) stay in-process
+        if self.max_workers > 1 and len(ibi_lists) >= self.parallel_min_windows:
+            chunk_size = -(-len(ibi_lists) // self.max_workers)
+            chunks = [
+                ibi_lists[start:start + chunk_size]
+                for start in range(0, len(ibi_lists), chunk_size)
+            ]
+            executor = _get_process_pool(self.max_workers)
+            try:
+                return [
+                    features
+                    for chunk in executor.map(self.extract_all_features_batch, chunks)
+                    for features in chunk
+                ]
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM-killed); replace the pool on the next
+                # parallel batch and finish this one in-process
+                _discard_process_pool(self.max_workers, executor)
+        return self.extract_all_features_batch(ibi_lists)
+    
+    @staticmethod
+    def _welch_input_signal(rr_intervals: List[float]) -> Optional[np.ndarray]:
+        """
+        Resample RR intervals to 4 Hz the way hrvanalysis does before Welch
+        
+        Args:
+            rr_intervals: Cleaned RR intervals
+            
+        Returns:
+            Mean-removed 4 Hz signal, or None if the window cannot be batched
+            (too short, contains NaN, or needs more than one Welch segment)
+        """
+        if len(rr_intervals) < 10:
+            return None
+        
+        rr = np.asarray(rr_intervals, dtype=np.float64)
+        if not np.isfinite(rr).all():
+            return None
+        
+        t = np.cumsum(rr) / 1000
+        t = t - t[0]
+        t_interp = np.arange(0, t[-1], 1 / _WELCH_FS)
+        if not 2 <= len(t_interp) <= _WELCH_MAX_NPERSEG:
+            return None
+        
+        signal = np.interp(t_interp, t, rr)
+        return signal - np.mean(signal)
+    
+    @staticmethod
+    def _window_ibi_arrays(ibi_col: pd.Series) -> List:
+        """
+        Split an IBI column into per-window sequences
+        
+        Args:
+            ibi_col: Arrow list<float32> column from HRVProcessor, or an object
+                column of lists
+            
+        Returns:
+            Zero-copy NumPy views into the Arrow values buffer, or the lists as-is
+        """
+        if not isinstance(ibi_col.dtype, pd.ArrowDtype):
+            return ibi_col.tolist()
+        
+        # Concatenated frames are backed by several chunks; view each in turn
+        windows = []
+        for list_array in pa.chunked_array(pa.array(ibi_col)).chunks:
+            offsets = list_array.offsets.to_numpy()
+            values = list_array.values.to_numpy(zero_copy_only=True)
+            windows.extend(values[start:end] for start, end in zip(offsets[:-1], offsets[1:]))
+        return windows
+    
+    def _cache_key(self, rr_intervals: List[float]) -> tuple:
+        """Build a feature-cache key from the extractor settings and raw IBI buffer"""
+        buf = np.asarray(rr_intervals, dtype=np.float64).tobytes()
+        return (self.remove_outliers_flag, self.ectopic_detection, buf)
+    
     @staticmethod
     def _empty_time_features() -> Dict:
         """Return empty time-domain features"""
@@ -8,7 +8,10 @@ from app.config import API_KEY
 from app.routes.hrv_day import router as hrv_day_router
 from app.schemas import HRVResponse, SummaryMetrics, TimeBucket
 
-app = FastAPI(title="NeuroHeart HRV API", version="1.0.0")
+app = FastAPI(
+    title="NeuroHeart HRV API",
+    version="1.0.0",
+)
 app.include_router(hrv_day_router)
 
 
@@ -28,11 +31,12 @@ def hrv_analysis(
 
     result = compute_hrv_for_range(user_id, range)
 
-    return HRVResponse(
+    # Result is produced internally with the right types, so skip re-validation
+    return HRVResponse.model_construct(
         user_id=result["user_id"],
         range=result["range"],
         generated_at=datetime.fromisoformat(result["generated_at"]),
-        summary_metrics=SummaryMetrics(**result["summary_metrics"]),
-        time_series=[TimeBucket(**b) for b in result["time_series"]],
+        summary_metrics=SummaryMetrics.model_construct(**result["summary_metrics"]),
+        time_series=[TimeBucket.model_construct(**b) for b in result["time_series"]],
         patterns=result["patterns"],
     )
@@ -4,30 +4,27 @@ import zoneinfo
 import pandas as pd
 from fastapi import APIRouter, Header, HTTPException, Query
 
+from app.analysis import _safe_float_list
 from app.config import API_KEY, TZ
 from app.db import get_heart_rate_data
 from app.hrv_features import HRVFeatureExtractor
 from app.hrv_processor import HRVProcessor
+from app.schemas import DayHRVResponse, HourlyHRV, RangeDayHRV, RangeHRVResponse
 
 router = APIRouter()
 
 _user_tz = zoneinfo.ZoneInfo(TZ)
 
+_HRV_COLS = ["rmssd", "sdnn", "mean_hr", "lf_hf_ratio"]
+
+_processor = HRVProcessor()
+_extractor = HRVFeatureExtractor()
+
 
 # ---------------------------------------------------------------------------
 # Shared helpers
 # ---------------------------------------------------------------------------
 
-def _safe_float(val):
-    if val is None:
-        return None
-    try:
-        f = float(val)
-        return None if (f != f) else f
-    except (TypeError, ValueError):
-        return None
-
-
 def _parse_date(date_str: str) -> datetime:
     """Parse YYYY-MM-DD → tz-aware datetime in user TZ. Raises HTTPException on bad input."""
     try:
@@ -36,20 +33,20 @@ def _parse_date(date_str: str) -> datetime:
         raise HTTPException(status_code=400, detail=f"Invalid date '{date_str}'. Use YYYY-MM-DD.")
 
 
-def _hourly_hrv_for_window(df_raw: pd.DataFrame) -> list[dict]:
+def _hourly_hrv_for_window(df_raw: pd.DataFrame) -> list[HourlyHRV]:
     """
     Given a raw heart-rate DataFrame (timestamp TZ-aware, bpm float),
-    run the full HRV pipeline and return a list of hourly metric dicts.
+    run the full HRV pipeline and return a list of hourly metrics.
     Returns an empty list if there is insufficient data.
     """
     if df_raw.empty:
         return []
 
-    df_windows = HRVProcessor().process(df_raw)
+    df_windows = _processor.process(df_raw)
     if df_windows.empty:
         return []
 
-    df_hrv = HRVFeatureExtractor().process_windows(df_windows)
+    df_hrv = _extractor.process_windows(df_windows)
     if df_hrv.empty:
         return []
 
@@ -57,26 +54,34 @@ def _hourly_hrv_for_window(df_raw: pd.DataFrame) -> list[dict]:
     if df_hrv["timestamp"].dt.tz is None:
         df_hrv["timestamp"] = df_hrv["timestamp"].dt.tz_localize(TZ)
 
-    df_hrv["hour"] = df_hrv["timestamp"].dt.hour
-
-    hourly = []
-    for hr in sorted(df_hrv["hour"].unique()):
-        block = df_hrv[df_hrv["hour"] == hr]
-        hourly.append({
-            "hour":        int(hr),
-            "rmssd":       _safe_float(block["rmssd"].mean()),
-            "sdnn":        _safe_float(block["sdnn"].mean()),
-            "mean_hr":     _safe_float(block["mean_hr"].mean()),
-            "lf_hf_ratio": _safe_float(block["lf_hf_ratio"].mean()),
-        })
-    return hourly
+    hourly_means = (
+        df_hrv
+        .groupby(df_hrv["timestamp"].dt.hour.rename("hour"), sort=True)[_HRV_COLS]
+        .mean()
+        .reset_index()
+    )
+
+    # Values are already plain ints/floats/None, so skip re-validation
+    return [
+        HourlyHRV.model_construct(
+            hour=hour,
+            rmssd=rmssd,
+            sdnn=sdnn,
+            mean_hr=mean_hr,
+            lf_hf_ratio=lf_hf_ratio,
+        )
+        for hour, rmssd, sdnn, mean_hr, lf_hf_ratio in zip(
+            hourly_means["hour"].astype(int).tolist(),
+            *(_safe_float_list(hourly_means[c]) for c in _HRV_COLS),
+        )
+    ]
 
 
 # ---------------------------------------------------------------------------
 # GET /v1/hrv/day  — single day, hourly HRV
 # ---------------------------------------------------------------------------
 
-@router.get("/v1/hrv/day")
+@router.get("/v1/hrv/day", response_model=DayHRVResponse)
 def hrv_by_day(
     user_id: str = Query(..., description="User UUID"),
     date: str = Query(..., description="YYYY-MM-DD in user timezone"),
@@ -100,19 +105,19 @@ def hrv_by_day(
     if not hourly_results:
         raise HTTPException(status_code=404, detail="Insufficient HR data for hourly HRV.")
 
-    return {
-        "user_id":         user_id,
-        "date":            date,
-        "hours_available": len(hourly_results),
-        "hourly":          hourly_results,
-    }
+    return DayHRVResponse.model_construct(
+        user_id=user_id,
+        date=date,
+        hours_available=len(hourly_results),
+        hourly=hourly_results,
+    )
 
 
 # ---------------------------------------------------------------------------
 # GET /v1/hrv/range  — date range, hourly HRV per day
 # ---------------------------------------------------------------------------
 
-@router.get("/v1/hrv/range")
+@router.get("/v1/hrv/range", response_model=RangeHRVResponse)
 def hrv_by_range(
     user_id: str = Query(..., description="User UUID"),
     start_date: str = Query(..., description="Start date YYYY-MM-DD (inclusive)"),
@@ -145,30 +150,33 @@ def hrv_by_range(
     if df_all.empty:
         raise HTTPException(status_code=404, detail="No samples inside specified date range.")
 
-    # Process each day
+    # Partition into local calendar days in one pass, then process each day
+    days_by_start = dict(iter(df_all.groupby(df_all["timestamp"].dt.normalize())))
+    df_empty = df_all.iloc[0:0]
+
     days_output = []
     current = range_start
     while current < range_end_exclusive:
         next_day = current + timedelta(days=1)
-        df_day = df_all[(df_all["timestamp"] >= current) & (df_all["timestamp"] < next_day)]
+        df_day = days_by_start.get(pd.Timestamp(current), df_empty)
 
         day_str = current.strftime("%Y-%m-%d")
         hourly = _hourly_hrv_for_window(df_day)
 
-        days_output.append({
-            "date":            day_str,
-            "hours_available": len(hourly),
-            "hourly":          hourly,
-        })
+        days_output.append(RangeDayHRV.model_construct(
+            date=day_str,
+            hours_available=len(hourly),
+            hourly=hourly,
+        ))
         current = next_day
 
-    days_with_data = sum(1 for d in days_output if d["hours_available"] > 0)
+    days_with_data = sum(1 for d in days_output if d.hours_available > 0)
 
-    return {
-        "user_id":        user_id,
-        "start_date":     start_date,
-        "end_date":       end_date,
-        "total_days":     total_days,
-        "days_with_data": days_with_data,
-        "days":           days_output,
-    }
+    return RangeHRVResponse.model_construct(
+        user_id=user_id,
+        start_date=start_date,
+        end_date=end_date,
+        total_days=total_days,
+        days_with_data=days_with_data,
+        days=days_output,
+    )
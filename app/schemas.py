@@ -28,3 +28,33 @@ class HRVResponse(BaseModel):
     summary_metrics: SummaryMetrics
     time_series: List[TimeBucket]
     patterns: Optional[dict] = None
+
+
+class HourlyHRV(BaseModel):
+    hour: int
+    rmssd: Optional[float] = None
+    sdnn: Optional[float] = None
+    mean_hr: Optional[float] = None
+    lf_hf_ratio: Optional[float] = None
+
+
+class DayHRVResponse(BaseModel):
+    user_id: str
+    date: str
+    hours_available: int
+    hourly: List[HourlyHRV]
+
+
+class RangeDayHRV(BaseModel):
+    date: str
+    hours_available: int
+    hourly: List[HourlyHRV]
+
+
+class RangeHRVResponse(BaseModel):
+    user_id: str
+    start_date: str
+    end_date: str
+    total_days: int
+    days_with_data: int
+    days: List[RangeDayHRV]
@@ -5,18 +5,84 @@ Analyzes HRV patterns across hours and weekdays
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List
+from numba import njit
+from typing import Dict, List, Tuple
+
+# Weekday x hour cells, keyed weekday * 24 + hour
+_N_CELLS = 7 * 24
+
+# Key dtypes for the hour and weekday (Monday=0) columns of prepared frames
+_HOUR_DTYPE = pd.CategoricalDtype(range(24), ordered=True)
+_WEEKDAY_DTYPE = pd.CategoricalDtype(range(7), ordered=True)
+
+# DataFrame.attrs flag marking frames already returned by prepare_temporal_features
+_PREPARED_ATTR = '_wa_prepared'
+
+
+@njit(cache=True)
+def _accumulate_cells(keys: np.ndarray, values: np.ndarray) -> tuple:
+    """
+    Accumulate per-cell moments of every metric in a single pass over the rows
+
+    Args:
+        keys: Cell key (weekday * 24 + hour) per row
+        values: float64 array of shape (rows, metrics); NaNs are skipped
+
+    Returns:
+        Tuple (rows, counts, sums, sums_sq, mins, maxs); rows has one entry
+        per cell, the rest have shape (cells, metrics). Extrema of cells
+        without valid values are +inf/-inf
+    """
+    n_metrics = values.shape[1]
+    rows = np.zeros(_N_CELLS, dtype=np.int64)
+    counts = np.zeros((_N_CELLS, n_metrics), dtype=np.int64)
+    sums = np.zeros((_N_CELLS, n_metrics))
+    sums_sq = np.zeros((_N_CELLS, n_metrics))
+    mins = np.full((_N_CELLS, n_metrics), np.inf)
+    maxs = np.full((_N_CELLS, n_metrics), -np.inf)
+    for i in range(keys.shape[0]):
+        k = keys[i]
+        rows[k] += 1
+        for j in range(n_metrics):
+            v = values[i, j]
+            if np.isnan(v):
+                continue
+            counts[k, j] += 1
+            sums[k, j] += v
+            sums_sq[k, j] += v * v
+            mins[k, j] = min(mins[k, j], v)
+            maxs[k, j] = max(maxs[k, j], v)
+    return rows, counts, sums, sums_sq, mins, maxs
 
 
 class WeeklyAnalyzer:
     """Analyze weekly and hourly HRV patterns"""
     
-    def __init__(self):
-        """Initialize weekly analyzer"""
+    # HRV metrics aggregated into the weekday x hour cells
+    metrics = ['rmssd', 'sdnn', 'mean_hr', 'lf_hf_ratio']
+    
+    # Columns added by prepare_temporal_features
+    _temporal_columns = frozenset(['hour', 'weekday', 'date', 'is_weekend'])
+    
+    # Workweek difficulty labels by rank, hardest (lowest RMSSD) first
+    _DIFF_LABELS = np.array(['Hardest', 'Hard', 'Medium', 'Easy', 'Easiest'], dtype=object)
+    
+    def __init__(self, backend: str = 'pandas'):
+        """
+        Initialize weekly analyzer
+        
+        Args:
+            backend: Aggregation engine, 'pandas' or 'polars' (requires the
+                optional polars package)
+        """
+        if backend not in ('pandas', 'polars'):
+            raise ValueError(f"Unknown backend: {backend!r} (expected 'pandas' or 'polars')")
+        self.backend = backend
         self.weekday_names = [
             'Monday', 'Tuesday', 'Wednesday', 'Thursday', 
             'Friday', 'Saturday', 'Sunday'
         ]
+        self._weekday_names_arr = np.array(self.weekday_names, dtype=object)
     
     def prepare_temporal_features(self, df_hrv: pd.DataFrame) -> pd.DataFrame:
         """
@@ -28,18 +94,38 @@ class WeeklyAnalyzer:
         Returns:
             DataFrame with added temporal columns
         """
-        df = df_hrv.copy()
+        # Frames this method returned are stamped; preparing them again is a no-op
+        if df_hrv.attrs.get(_PREPARED_ATTR) and self._temporal_columns.issubset(df_hrv.columns):
+            return df_hrv
+        
+        # Build only the new columns and attach them with assign, which shares
+        # the existing column data instead of copying the whole frame
+        cols = {}
         
         # Ensure timestamp is datetime
-        if not pd.api.types.is_datetime64_any_dtype(df['timestamp']):
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
+        timestamp = df_hrv['timestamp']
+        if not pd.api.types.is_datetime64_any_dtype(timestamp):
+            timestamp = pd.to_datetime(timestamp)
+            cols['timestamp'] = timestamp
         
-        # Extract temporal features
-        df['hour'] = df['timestamp'].dt.hour
-        df['weekday'] = df['timestamp'].dt.dayofweek
-        df['weekday_name'] = df['timestamp'].dt.day_name()
-        df['date'] = df['timestamp'].dt.date
-        df['is_weekend'] = df['weekday'].isin([5, 6])
+        # Extract temporal features from local wall-clock time with integer
+        # arithmetic on whole hours since the epoch (1970-01-01 was a Thursday)
+        local = timestamp
+        if local.dt.tz is not None:
+            local = local.dt.tz_localize(None)
+        local = local.to_numpy()
+        hours = local.astype('datetime64[h]').view('i8')
+        weekday = (hours // 24 + 3) % 7
+        
+        # Fixed-cardinality categoricals: groupby maps their codes straight to
+        # group ids instead of hashing the key values
+        cols['hour'] = pd.Categorical.from_codes((hours % 24).astype(np.int8), dtype=_HOUR_DTYPE)
+        cols['weekday'] = pd.Categorical.from_codes(weekday.astype(np.int8), dtype=_WEEKDAY_DTYPE)
+        cols['date'] = local.astype('datetime64[D]').astype(object)
+        cols['is_weekend'] = weekday >= 5
+        
+        df = df_hrv.assign(**cols)
+        df.attrs[_PREPARED_ATTR] = True
         
         return df
     
@@ -53,19 +139,8 @@ class WeeklyAnalyzer:
         Returns:
             DataFrame with hourly statistics
         """
-        df = self.prepare_temporal_features(df_hrv)
-        
-        hourly_stats = df.groupby('hour').agg({
-            'rmssd': ['mean', 'std', 'min', 'max', 'count'],
-            'sdnn': ['mean', 'std'],
-            'mean_hr': ['mean', 'std'],
-            'lf_hf_ratio': ['mean', 'std']
-        }).reset_index()
-        
-        # Flatten column names
-        hourly_stats.columns = ['_'.join(col).strip('_') for col in hourly_stats.columns.values]
-        
-        return hourly_stats
+        _, hourly, _ = self._stats(df_hrv)
+        return self._hourly_patterns_from_stats(hourly)
     
     def get_best_hrv_hours(self, df_hrv: pd.DataFrame, top_n: int = 5) -> pd.DataFrame:
         """
@@ -78,12 +153,9 @@ class WeeklyAnalyzer:
         Returns:
             DataFrame with top hours sorted by RMSSD
         """
-        df = self.prepare_temporal_features(df_hrv)
-        hourly_avg = df.groupby('hour')['rmssd'].mean().reset_index()
-        hourly_avg = hourly_avg.sort_values('rmssd', ascending=False).head(top_n)
-        hourly_avg.columns = ['hour', 'avg_rmssd']
-        
-        return hourly_avg
+        _, hourly = self._rmssd_means(df_hrv)
+        best, _ = self._best_and_worst_hours_from_stats(hourly, top_n)
+        return pd.DataFrame(best, columns=['hour', 'avg_rmssd'])
     
     def get_worst_hrv_hours(self, df_hrv: pd.DataFrame, top_n: int = 5) -> pd.DataFrame:
         """
@@ -96,12 +168,9 @@ class WeeklyAnalyzer:
         Returns:
             DataFrame with worst hours sorted by RMSSD
         """
-        df = self.prepare_temporal_features(df_hrv)
-        hourly_avg = df.groupby('hour')['rmssd'].mean().reset_index()
-        hourly_avg = hourly_avg.sort_values('rmssd', ascending=True).head(top_n)
-        hourly_avg.columns = ['hour', 'avg_rmssd']
-        
-        return hourly_avg
+        _, hourly = self._rmssd_means(df_hrv)
+        _, worst = self._best_and_worst_hours_from_stats(hourly, top_n)
+        return pd.DataFrame(worst, columns=['hour', 'avg_rmssd'])
     
     def get_best_hrv_hours_per_weekday(self, df_hrv: pd.DataFrame) -> Dict:
         """
@@ -113,20 +182,8 @@ class WeeklyAnalyzer:
         Returns:
             Dictionary mapping weekday to best hour info
         """
-        df = self.prepare_temporal_features(df_hrv)
-        
-        results = {}
-        for weekday in range(7):
-            df_day = df[df['weekday'] == weekday]
-            if len(df_day) > 0:
-                best_hour = df_day.groupby('hour')['rmssd'].mean().idxmax()
-                best_rmssd = df_day.groupby('hour')['rmssd'].mean().max()
-                results[self.weekday_names[weekday]] = {
-                    'hour': int(best_hour),
-                    'avg_rmssd': float(best_rmssd)
-                }
-        
-        return results
+        cells, _ = self._rmssd_means(df_hrv)
+        return self._extreme_hours_per_weekday_from_stats(cells, best=True)
     
     def get_worst_hrv_hours_per_weekday(self, df_hrv: pd.DataFrame) -> Dict:
         """
@@ -138,20 +195,8 @@ class WeeklyAnalyzer:
         Returns:
             Dictionary mapping weekday to worst hour info
         """
-        df = self.prepare_temporal_features(df_hrv)
-        
-        results = {}
-        for weekday in range(7):
-            df_day = df[df['weekday'] == weekday]
-            if len(df_day) > 0:
-                worst_hour = df_day.groupby('hour')['rmssd'].mean().idxmin()
-                worst_rmssd = df_day.groupby('hour')['rmssd'].mean().min()
-                results[self.weekday_names[weekday]] = {
-                    'hour': int(worst_hour),
-                    'avg_rmssd': float(worst_rmssd)
-                }
-        
-        return results
+        cells, _ = self._rmssd_means(df_hrv)
+        return self._extreme_hours_per_weekday_from_stats(cells, best=False)
     
     def get_most_stressful_weekdays(self, df_hrv: pd.DataFrame) -> pd.DataFrame:
         """
@@ -163,18 +208,8 @@ class WeeklyAnalyzer:
         Returns:
             DataFrame with weekdays ranked by average RMSSD (lowest first)
         """
-        df = self.prepare_temporal_features(df_hrv)
-        
-        weekday_stats = df.groupby(['weekday', 'weekday_name']).agg({
-            'rmssd': 'mean',
-            'mean_hr': 'mean',
-            'lf_hf_ratio': 'mean'
-        }).reset_index()
-        
-        weekday_stats = weekday_stats.sort_values('rmssd', ascending=True)
-        weekday_stats['stress_rank'] = range(1, len(weekday_stats) + 1)
-        
-        return weekday_stats
+        _, _, weekday = self._stats(df_hrv)
+        return self._most_stressful_weekdays_from_stats(weekday)
     
     def get_workweek_difficulty(self, df_hrv: pd.DataFrame) -> pd.DataFrame:
         """
@@ -186,42 +221,293 @@ class WeeklyAnalyzer:
         Returns:
             DataFrame with workweek days ranked by difficulty
         """
+        _, _, weekday = self._stats(df_hrv)
+        return self._workweek_difficulty_from_stats(weekday)
+    
+    def create_weekly_summary(self, df_hrv: pd.DataFrame) -> Dict:
+        """
+        Create comprehensive weekly analysis summary
+        
+        Args:
+            df_hrv: HRV DataFrame
+            
+        Returns:
+            Dictionary containing all weekly analyses
+        """
+        # Scan the metric columns once; every analysis below is derived from
+        # the weekday x hour aggregates and their marginals
+        cells, hourly, weekday = self._stats(df_hrv)
+        best_hours, worst_hours = self._best_and_worst_hours_from_stats(hourly)
+        
+        return {
+            'hourly_patterns': self._hourly_patterns_from_stats(hourly).to_dict('records'),
+            'best_hrv_hours': best_hours,
+            'worst_hrv_hours': worst_hours,
+            'best_hours_per_weekday': self._extreme_hours_per_weekday_from_stats(cells, best=True),
+            'worst_hours_per_weekday': self._extreme_hours_per_weekday_from_stats(cells, best=False),
+            'most_stressful_weekdays': self._most_stressful_weekdays_from_stats(weekday).to_dict('records'),
+            'workweek_difficulty': self._workweek_difficulty_from_stats(weekday).to_dict('records')
+        }
+    
+    def _stats(self, df_hrv: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """Compute (cell, hour, weekday) level statistics with the configured backend"""
+        if self.backend == 'polars':
+            return self._summary_stats_polars(df_hrv)
+        return self._summary_stats(self.prepare_temporal_features(df_hrv))
+    
+    def _rmssd_means(self, df_hrv: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Compute only the mean RMSSD per (weekday, hour) cell and per hour
+        
+        The best/worst hour getters need nothing else, so the pandas backend
+        skips the full moment aggregation and accumulates the 7 x 24 cells
+        with np.bincount on the flat key weekday * 24 + hour.
+        
+        Args:
+            df_hrv: HRV DataFrame
+            
+        Returns:
+            Tuple of (cell, hour) level frames with an 'rmssd_mean' column,
+            indexed like _summary_stats
+        """
+        if self.backend == 'polars':
+            cells, hourly, _ = self._summary_stats_polars(df_hrv)
+            return cells, hourly
+        
         df = self.prepare_temporal_features(df_hrv)
+        keys = df['weekday'].cat.codes.to_numpy(np.intp) * 24 + df['hour'].cat.codes.to_numpy(np.intp)
+        rmssd = df['rmssd'].to_numpy(np.float64)
+        valid = ~np.isnan(rmssd)
         
-        # Filter to weekdays only (0-4 = Mon-Fri)
-        workweek = df[df['weekday'] < 5]
+        # rows: cells seen at all (a cell whose RMSSD is all NaN reports NaN);
+        # counts/sums: non-NaN RMSSD only, matching groupby mean
+        rows = np.bincount(keys, minlength=_N_CELLS).reshape(7, 24)
+        counts = np.bincount(keys[valid], minlength=_N_CELLS).reshape(7, 24)
+        sums = np.bincount(keys[valid], weights=rmssd[valid], minlength=_N_CELLS).reshape(7, 24)
         
-        if len(workweek) == 0:
-            return pd.DataFrame()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cell_means = sums / counts
+            hour_means = sums.sum(axis=0) / counts.sum(axis=0)
         
-        workweek_stats = workweek.groupby(['weekday', 'weekday_name']).agg({
-            'rmssd': 'mean',
-            'mean_hr': 'mean',
-            'sdnn': 'mean'
-        }).reset_index()
+        weekday_idx, hour_idx = np.nonzero(rows)
+        cells = pd.DataFrame(
+            {'rmssd_mean': cell_means[weekday_idx, hour_idx]},
+            index=pd.MultiIndex.from_arrays([weekday_idx, hour_idx], names=['weekday', 'hour'])
+        )
+        hours = np.flatnonzero(rows.sum(axis=0))
+        hourly = pd.DataFrame({'rmssd_mean': hour_means[hours]}, index=pd.Index(hours, name='hour'))
         
-        workweek_stats = workweek_stats.sort_values('rmssd', ascending=True)
-        workweek_stats['difficulty_rank'] = range(1, len(workweek_stats) + 1)
-        workweek_stats['difficulty_label'] = ['Hardest', 'Hard', 'Medium', 'Easy', 'Easiest'][:len(workweek_stats)]
+        return cells, hourly
+    
+    def _summary_stats_polars(self, df_hrv: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """
+        Polars counterpart of _summary_stats
         
-        return workweek_stats
+        The three group_by plans share one lazy scan of the source frame and
+        are collected together; only the small aggregates come back to pandas.
+        
+        Args:
+            df_hrv: HRV DataFrame with timestamp and metric columns
+            
+        Returns:
+            Tuple of (cell, hour, weekday) level statistics indexed like
+            _summary_stats, with '<metric>_mean', '<metric>_std' and
+            '<metric>_count' columns plus 'rmssd_min'/'rmssd_max'
+        """
+        try:
+            import polars as pl
+        except ImportError as e:
+            raise ImportError("WeeklyAnalyzer(backend='polars') requires the polars package") from e
+        
+        timestamp = df_hrv['timestamp']
+        if not pd.api.types.is_datetime64_any_dtype(timestamp):
+            timestamp = pd.to_datetime(timestamp)
+        
+        # dt.hour/dt.weekday on a zoned datetime give local wall-clock values
+        lf = pl.from_pandas(
+            pd.DataFrame({'timestamp': timestamp, **{col: df_hrv[col] for col in self.metrics}})
+        ).lazy().with_columns(
+            pl.col('timestamp').dt.hour().cast(pl.Int8).alias('hour'),
+            (pl.col('timestamp').dt.weekday() - 1).cast(pl.Int8).alias('weekday')
+        )
+        
+        metric_aggs = [
+            agg
+            for col in self.metrics
+            for agg in (
+                pl.col(col).mean().alias(f'{col}_mean'),
+                pl.col(col).std().alias(f'{col}_std'),
+                pl.col(col).count().alias(f'{col}_count')
+            )
+        ]
+        extrema = [pl.col('rmssd').min().alias('rmssd_min'), pl.col('rmssd').max().alias('rmssd_max')]
+        cells, hourly, weekday = pl.collect_all([
+            lf.group_by(['weekday', 'hour']).agg(pl.col('rmssd').mean().alias('rmssd_mean')),
+            lf.group_by('hour').agg(metric_aggs + extrema).sort('hour'),
+            lf.group_by('weekday').agg(metric_aggs)
+        ])
+        
+        return (
+            cells.to_pandas().set_index(['weekday', 'hour']),
+            hourly.to_pandas().set_index('hour'),
+            weekday.to_pandas().set_index('weekday')
+        )
     
-    def create_weekly_summary(self, df_hrv: pd.DataFrame) -> Dict:
+    def _summary_stats(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
         """
-        Create comprehensive weekly analysis summary
+        Aggregate metrics per (weekday, hour) cell in one pass over the rows
         
         Args:
-            df_hrv: HRV DataFrame
+            df: HRV DataFrame from prepare_temporal_features
             
         Returns:
-            Dictionary containing all weekly analyses
+            Tuple of (cell, hour, weekday) level statistics, each with
+            '<metric>_sum', '<metric>_count', '<metric>_sq' (sum of squares),
+            '<metric>_mean' and '<metric>_std' columns plus 'rmssd_min'/'rmssd_max'
         """
+        keys = df['weekday'].cat.codes.to_numpy(np.intp) * 24 + df['hour'].cat.codes.to_numpy(np.intp)
+        # Moments are accumulated in float64: the std derivation subtracts
+        # nearly equal sums
+        values = np.ascontiguousarray(df[self.metrics].to_numpy(np.float64))
+        rows, counts, sums, sums_sq, mins, maxs = _accumulate_cells(keys, values)
+        
+        # Marginals fold the 7 x 24 grid: sums add up, extrema combine with min/max
+        grid = [a.reshape(7, 24, *a.shape[1:]) for a in (rows, counts, sums, sums_sq)]
+        mins, maxs = mins.reshape(7, 24, -1), maxs.reshape(7, 24, -1)
+        
+        weekday_idx, hour_idx = np.nonzero(grid[0])
+        cells = self._accumulators_to_stats(
+            *(a[weekday_idx, hour_idx] for a in grid[1:]),
+            mins[weekday_idx, hour_idx], maxs[weekday_idx, hour_idx],
+            pd.MultiIndex.from_arrays([weekday_idx, hour_idx], names=['weekday', 'hour'])
+        )
+        
+        hours = np.flatnonzero(grid[0].sum(axis=0))
+        hourly = self._accumulators_to_stats(
+            *(a.sum(axis=0)[hours] for a in grid[1:]),
+            mins.min(axis=0)[hours], maxs.max(axis=0)[hours],
+            pd.Index(hours, name='hour')
+        )
+        
+        weekdays = np.flatnonzero(grid[0].sum(axis=1))
+        weekday = self._accumulators_to_stats(
+            *(a.sum(axis=1)[weekdays] for a in grid[1:]),
+            mins.min(axis=1)[weekdays], maxs.max(axis=1)[weekdays],
+            pd.Index(weekdays, name='weekday')
+        )
+        
+        return cells, hourly, weekday
+    
+    def _accumulators_to_stats(
+        self,
+        counts: np.ndarray,
+        sums: np.ndarray,
+        sums_sq: np.ndarray,
+        mins: np.ndarray,
+        maxs: np.ndarray,
+        index: pd.Index
+    ) -> pd.DataFrame:
+        """Build a statistics frame from (groups, metrics) accumulator arrays"""
+        cols = {}
+        for j, col in enumerate(self.metrics):
+            cols[f'{col}_sum'] = sums[:, j]
+            cols[f'{col}_count'] = counts[:, j]
+            cols[f'{col}_sq'] = sums_sq[:, j]
+        
+        rmssd = self.metrics.index('rmssd')
+        has_rmssd = counts[:, rmssd] > 0
+        cols['rmssd_min'] = np.where(has_rmssd, mins[:, rmssd], np.nan)
+        cols['rmssd_max'] = np.where(has_rmssd, maxs[:, rmssd], np.nan)
+        
+        stats = pd.DataFrame(cols, index=index)
+        self._add_mean_std(stats)
+        return stats
+    
+    def _add_mean_std(self, stats: pd.DataFrame) -> None:
+        """Derive mean and sample std (ddof=1) columns from sum/count/sum-of-squares"""
+        for col in self.metrics:
+            total = stats[f'{col}_sum']
+            count = stats[f'{col}_count']
+            with np.errstate(divide='ignore', invalid='ignore'):
+                mean = total / count
+                var = (stats[f'{col}_sq'] - total * mean) / (count - 1)
+            stats[f'{col}_mean'] = mean.where(count > 0)
+            stats[f'{col}_std'] = np.sqrt(var.clip(lower=0)).where(count > 1)
+    
+    def _hourly_patterns_from_stats(self, hourly: pd.DataFrame) -> pd.DataFrame:
+        """Select the hourly pattern columns from hour-level statistics"""
+        return hourly[[
+            'rmssd_mean', 'rmssd_std', 'rmssd_min', 'rmssd_max', 'rmssd_count',
+            'sdnn_mean', 'sdnn_std',
+            'mean_hr_mean', 'mean_hr_std',
+            'lf_hf_ratio_mean', 'lf_hf_ratio_std'
+        ]].reset_index()
+    
+    def _best_and_worst_hours_from_stats(
+        self, hourly: pd.DataFrame, top_n: int = 5
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """Find top and bottom RMSSD hours from hour-level statistics as records"""
+        # Sort once; the worst hours are the valid tail read backwards, with
+        # hours lacking RMSSD kept last as an ascending sort would place them
+        ordered = hourly['rmssd_mean'].sort_values(ascending=False)
+        n_valid = int(ordered.count())
+        records = [
+            {'hour': hour, 'avg_rmssd': value}
+            for hour, value in zip(ordered.index.tolist(), ordered.tolist())
+        ]
+        
+        best = records[:top_n]
+        worst = (records[:n_valid][::-1] + records[n_valid:])[:top_n]
+        
+        return best, worst
+    
+    def _extreme_hours_per_weekday_from_stats(self, cells: pd.DataFrame, best: bool) -> Dict:
+        """Pick the best (or worst) RMSSD hour within each weekday from cell statistics"""
+        weekday_hourly_avg = cells['rmssd_mean']
+        by_weekday = weekday_hourly_avg.groupby(level='weekday', observed=True)
+        extreme_idx = by_weekday.idxmax() if best else by_weekday.idxmin()
+        
+        # One bulk lookup and tolist() per column instead of per-weekday scalar
+        # access; tolist() already yields Python ints/floats
+        hours = [hour for _, hour in extreme_idx.tolist()]
+        values = weekday_hourly_avg.loc[extreme_idx.to_numpy()].tolist()
+        
         return {
-            'hourly_patterns': self.get_hourly_patterns(df_hrv).to_dict('records'),
-            'best_hrv_hours': self.get_best_hrv_hours(df_hrv).to_dict('records'),
-            'worst_hrv_hours': self.get_worst_hrv_hours(df_hrv).to_dict('records'),
-            'best_hours_per_weekday': self.get_best_hrv_hours_per_weekday(df_hrv),
-            'worst_hours_per_weekday': self.get_worst_hrv_hours_per_weekday(df_hrv),
-            'most_stressful_weekdays': self.get_most_stressful_weekdays(df_hrv).to_dict('records'),
-            'workweek_difficulty': self.get_workweek_difficulty(df_hrv).to_dict('records')
+            self.weekday_names[weekday]: {'hour': hour, 'avg_rmssd': value}
+            for weekday, hour, value in zip(extreme_idx.index.tolist(), hours, values)
         }
+    
+    def _weekday_means(self, weekday: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
+        """Build a weekday, weekday_name, <metric means> frame from weekday-level statistics"""
+        weekdays = weekday.index.to_numpy()
+        return pd.DataFrame({
+            'weekday': weekdays,
+            'weekday_name': self._weekday_names_arr[weekdays],
+            **{col: weekday[f'{col}_mean'].to_numpy() for col in cols}
+        })
+    
+    def _most_stressful_weekdays_from_stats(self, weekday: pd.DataFrame) -> pd.DataFrame:
+        """Rank weekdays by stress from weekday-level statistics"""
+        weekday_stats = self._weekday_means(weekday, ['rmssd', 'mean_hr', 'lf_hf_ratio'])
+        
+        weekday_stats = weekday_stats.sort_values('rmssd', ascending=True, ignore_index=True)
+        weekday_stats['stress_rank'] = np.arange(1, len(weekday_stats) + 1, dtype=np.int8)
+        
+        return weekday_stats
+    
+    def _workweek_difficulty_from_stats(self, weekday: pd.DataFrame) -> pd.DataFrame:
+        """Rank workweek days by difficulty from weekday-level statistics"""
+        # Filter to weekdays only (0-4 = Mon-Fri)
+        workweek = weekday[weekday.index < 5]
+        
+        if len(workweek) == 0:
+            return pd.DataFrame()
+        
+        workweek_stats = self._weekday_means(workweek, ['rmssd', 'mean_hr', 'sdnn'])
+        
+        workweek_stats = workweek_stats.sort_values('rmssd', ascending=True, ignore_index=True)
+        workweek_stats['difficulty_rank'] = np.arange(1, len(workweek_stats) + 1, dtype=np.int8)
+        workweek_stats['difficulty_label'] = self._DIFF_LABELS[:len(workweek_stats)]
+        
+        return workweek_stats
+
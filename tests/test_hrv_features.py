@@ -0,0 +1,148 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.hrv_features import HRVFeatureExtractor
+from app.hrv_processor import HRVProcessor
+
+
+def _heart_rate(start, n=600, spacing_s=10, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "timestamp": pd.Timestamp(start, tz="UTC") + pd.to_timedelta(np.arange(n) * spacing_s, unit="s"),
+        "bpm": rng.normal(65, 5, n),
+    })
+
+
+def test_process_windows_accepts_multi_chunk_ibi_column():
+    processor = HRVProcessor()
+    parts = [
+        processor.process(_heart_rate("2026-09-01", seed=1)),
+        processor.process(_heart_rate("2026-09-02", seed=2)),
+    ]
+    df_windows = pd.concat(parts, ignore_index=True)
+
+    ibis = HRVFeatureExtractor._window_ibi_arrays(df_windows["ibi_ms"])
+    assert len(ibis) == len(df_windows)
+    for got, want in zip(ibis, df_windows["ibi_ms"]):
+        np.testing.assert_array_equal(got, np.asarray(want))
+
+    extractor = HRVFeatureExtractor(max_workers=1)
+    combined = extractor.process_windows(df_windows)
+    separate = pd.concat([extractor.process_windows(part) for part in parts], ignore_index=True)
+    pd.testing.assert_frame_equal(combined, separate)
+
+
+def test_broken_process_pool_is_replaced_and_batch_finishes_in_process():
+    from concurrent.futures.process import BrokenProcessPool
+
+    from app import hrv_features
+
+    class _BrokenPool:
+        shut_down = False
+
+        def map(self, fn, *iterables):
+            raise BrokenProcessPool("worker died")
+
+        def shutdown(self, wait=True, cancel_futures=False):
+            self.shut_down = True
+
+    broken = _BrokenPool()
+    hrv_features._process_pools[2] = broken
+    try:
+        rng = np.random.default_rng(3)
+        ibi_lists = [rng.normal(900, 40, 15) for _ in range(4)]
+        extractor = HRVFeatureExtractor(max_workers=2, parallel_min_windows=1)
+
+        result = extractor._extract_batch(ibi_lists)
+
+        pd.testing.assert_frame_equal(
+            pd.DataFrame(result), pd.DataFrame(extractor.extract_all_features_batch(ibi_lists))
+        )
+        assert broken.shut_down
+        assert hrv_features._process_pools.get(2) is not broken
+    finally:
+        hrv_features._process_pools.pop(2, None)
+
+
+def _assert_features_close(got, want, rtol):
+    assert set(got) == set(want)
+    for key, value in want.items():
+        np.testing.assert_allclose(got[key], value, rtol=rtol, atol=1e-12, equal_nan=True, err_msg=key)
+
+
+@pytest.mark.parametrize("n", [2, 3, 15, 100, 511, 512, 600])
+def test_time_domain_kernel_matches_hrvanalysis(n):
+    from hrvanalysis import get_time_domain_features
+
+    from app.hrv_features import _NUMBA_TIME_DOMAIN_MAX_LEN, _time_domain_numba
+
+    extractor = HRVFeatureExtractor()
+    rng = np.random.default_rng(n)
+    for _ in range(20):
+        rr = rng.normal(900, rng.uniform(5, 120), n).clip(350, 1900)
+        want = get_time_domain_features(rr.tolist())
+
+        _assert_features_close(extractor.extract_time_domain(rr.tolist()), want, rtol=1e-9)
+        if n < _NUMBA_TIME_DOMAIN_MAX_LEN:
+            got = dict(zip(extractor._empty_time_features(), _time_domain_numba(rr)))
+            _assert_features_close(got, want, rtol=1e-9)
+
+
+def test_time_domain_kernel_matches_hrvanalysis_on_float32_windows():
+    from hrvanalysis import get_time_domain_features
+
+    extractor = HRVFeatureExtractor()
+    rng = np.random.default_rng(7)
+    for n in (10, 60, 300):
+        rr = rng.normal(850, 60, n).astype(np.float32)
+        want = get_time_domain_features(rr.astype(np.float64).tolist())
+        _assert_features_close(extractor.extract_time_domain(rr), want, rtol=1e-6)
+
+
+def test_time_domain_windows_with_nan_keep_hrvanalysis_semantics():
+    from hrvanalysis import get_time_domain_features
+
+    extractor = HRVFeatureExtractor()
+    rng = np.random.default_rng(11)
+    for n in (15, 100, 600):
+        rr = rng.normal(900, 50, n)
+        rr[rng.random(n) < 0.1] = np.nan
+        rr[0] = np.nan
+        want = get_time_domain_features(rr.tolist())
+        _assert_features_close(extractor.extract_time_domain(rr.tolist()), want, rtol=1e-12)
+
+
+def _rr_with_welch_length(rng, target):
+    """Random RR intervals whose 4 Hz resampled signal has exactly `target` samples."""
+    rr = rng.normal(900, 50, 400).clip(400, 1800)
+    # Span (excluding the first interval) of (target - 0.5) resampling steps
+    span_ms = (target - 0.5) * 250.0
+    for n in range(3, len(rr)):
+        last = span_ms - rr[1:n - 1].sum()
+        if 500 <= last <= 1300:
+            return np.append(rr[:n - 1], last)
+    raise AssertionError(f"cannot build a window resampling to {target} samples")
+
+
+@pytest.mark.filterwarnings("ignore:nperseg")
+def test_batched_welch_matches_hrvanalysis():
+    from hrvanalysis import get_frequency_domain_features
+
+    from app.hrv_features import _WELCH_MAX_NPERSEG
+
+    extractor = HRVFeatureExtractor()
+    rng = np.random.default_rng(5)
+    windows = [rng.normal(900, 60, n).clip(400, 1800) for n in (10, 12, 15, 30, 100, 300)]
+    for target in (_WELCH_MAX_NPERSEG - 1, _WELCH_MAX_NPERSEG, _WELCH_MAX_NPERSEG + 1):
+        windows += [_rr_with_welch_length(rng, target) for _ in range(3)]
+
+    # Both the batched FFT path and the per-window fallback are exercised
+    batched = [extractor._welch_input_signal(rr.tolist()) is not None for rr in windows]
+    assert any(batched) and not all(batched)
+
+    results = extractor.extract_frequency_domain_batch([rr.tolist() for rr in windows])
+    for rr, got in zip(windows, results):
+        want = get_frequency_domain_features(rr.tolist())
+        for key in ("lf", "hf", "lf_hf_ratio", "total_power"):
+            np.testing.assert_allclose(got[key], want[key], rtol=1e-9, err_msg=f"{key} (n={len(rr)})")
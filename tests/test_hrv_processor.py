@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.hrv_processor import HRVProcessor
+
+
+def _heart_rate(spacing_s, n, jitter_s=0.0, seed=0):
+    rng = np.random.default_rng(seed)
+    offsets = np.arange(n) * spacing_s + rng.uniform(0, jitter_s, n)
+    return pd.DataFrame({
+        "timestamp": pd.Timestamp("2026-09-01", tz="America/New_York") + pd.to_timedelta(offsets, unit="s"),
+        "bpm": rng.normal(65, 5, n),
+    })
+
+
+def _two_stage_windows(df_ibi, window_minutes=15):
+    """Reference: 1-minute mean, time interpolation, then window binning."""
+    minutes = df_ibi.set_index("timestamp")[["bpm", "ibi_ms"]].resample("1min").mean()
+    minutes["ibi_ms"] = minutes["ibi_ms"].interpolate(method="time")
+    resampler = minutes.resample(f"{window_minutes}min")
+    sizes = resampler["ibi_ms"].size()
+    labels = sizes.index[sizes > 0]
+    ibis = [
+        minutes["ibi_ms"].loc[(minutes.index >= start) & (minutes.index < start + pd.Timedelta(minutes=window_minutes))]
+        .dropna().to_numpy()
+        for start in labels
+    ]
+    return labels, ibis, resampler["bpm"].mean()[sizes > 0]
+
+
+@pytest.mark.parametrize(
+    "spacing_s, jitter_s",
+    [
+        (300, 0.0),   # one sample every 5 minutes
+        (55, 20.0),   # roughly one per minute, some minutes empty or doubled
+        (60, 0.0),    # exactly one sample per minute
+        (5, 0.0),     # dense input
+    ],
+)
+def test_window_contents_match_two_stage_resample(spacing_s, jitter_s):
+    processor = HRVProcessor()
+    df_ibi = processor.calculate_ibi(_heart_rate(spacing_s, 24 * 3600 // spacing_s, jitter_s))
+
+    windows = processor.resample_to_windows(df_ibi)
+    expected_labels, expected_ibis, expected_bpm = _two_stage_windows(df_ibi)
+
+    assert windows["timestamp"].tolist() == expected_labels.tolist()
+    np.testing.assert_allclose(windows["bpm"].to_numpy(), expected_bpm.to_numpy())
+    for got, want in zip(windows["ibi_ms"], expected_ibis):
+        np.testing.assert_allclose(np.asarray(got, dtype=np.float64), want, rtol=1e-6)
+
+
+def test_sparse_windows_keep_interpolated_minutes():
+    processor = HRVProcessor()
+    windows = processor.process(_heart_rate(300, 288))
+
+    # Interior windows are filled minute by minute, not just the 3 raw samples
+    assert all(len(ibis) == 15 for ibis in windows["ibi_ms"].iloc[:-1])
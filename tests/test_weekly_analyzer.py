@@ -0,0 +1,169 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.weekly_analyzer import WeeklyAnalyzer
+
+METRICS = ["rmssd", "sdnn", "mean_hr", "lf_hf_ratio"]
+
+
+def _hrv_frame(seed=0, n=3000, tz="America/New_York"):
+    rng = np.random.default_rng(seed)
+    offsets = np.sort(rng.integers(0, 40 * 86400, n))
+    df = pd.DataFrame({
+        "timestamp": pd.Timestamp("2026-09-01", tz=tz) + pd.to_timedelta(offsets, unit="s"),
+        "rmssd": rng.normal(50, 10, n),
+        "sdnn": rng.normal(45, 8, n),
+        "mean_hr": rng.normal(65, 5, n),
+        "lf_hf_ratio": rng.gamma(2, 1, n),
+    })
+    hour = df["timestamp"].dt.hour
+    weekday = df["timestamp"].dt.dayofweek
+    # Empty cells: no rows at all between 02:00 and 03:00, nor on Sunday mornings
+    df = df[(hour != 2) & ~((weekday == 6) & (hour < 6))]
+    hour, weekday = df["timestamp"].dt.hour, df["timestamp"].dt.dayofweek
+    # All-NaN RMSSD: the whole 04:00 hour, and Tuesday 10:00
+    df.loc[(hour == 4) | ((weekday == 1) & (hour == 10)), "rmssd"] = np.nan
+    df.loc[rng.random(len(df)) < 0.1, "sdnn"] = np.nan
+    return df.reset_index(drop=True)
+
+
+def _reference(df):
+    df = df.assign(hour=df["timestamp"].dt.hour, weekday=df["timestamp"].dt.dayofweek)
+    hourly = df.groupby("hour")[METRICS].agg(["mean", "std", "min", "max", "count"])
+    cells = df.groupby(["weekday", "hour"])["rmssd"].mean()
+    weekday = df.groupby("weekday")[METRICS].mean()
+    return hourly, cells, weekday
+
+
+def _records_close(got, want):
+    assert len(got) == len(want)
+    for g, w in zip(got, want):
+        assert g.keys() == w.keys()
+        for key, value in w.items():
+            if isinstance(value, str):
+                assert g[key] == value
+            else:
+                np.testing.assert_allclose(g[key], value, rtol=1e-9, equal_nan=True, err_msg=key)
+
+
+@pytest.fixture(params=["America/New_York", "Asia/Kolkata"])
+def df_hrv(request):
+    return _hrv_frame(tz=request.param)
+
+
+def test_weekly_summary_matches_groupby_reference(df_hrv):
+    analyzer = WeeklyAnalyzer()
+    summary = analyzer.create_weekly_summary(df_hrv)
+    hourly, cells, weekday = _reference(df_hrv)
+
+    expected_hourly = [
+        {
+            "hour": hour,
+            "rmssd_mean": row[("rmssd", "mean")],
+            "rmssd_std": row[("rmssd", "std")],
+            "rmssd_min": row[("rmssd", "min")],
+            "rmssd_max": row[("rmssd", "max")],
+            "rmssd_count": row[("rmssd", "count")],
+            **{f"{m}_{s}": row[(m, s)] for m in METRICS[1:] for s in ("mean", "std")},
+        }
+        for hour, row in hourly.iterrows()
+    ]
+    _records_close(summary["hourly_patterns"], expected_hourly)
+    assert 2 not in [r["hour"] for r in summary["hourly_patterns"]]
+    assert np.isnan(next(r for r in summary["hourly_patterns"] if r["hour"] == 4)["rmssd_min"])
+
+    hour_means = hourly[("rmssd", "mean")]
+    valid = hour_means.dropna()
+    expected_best = valid.sort_values(ascending=False).head(5)
+    expected_worst = valid.sort_values().head(5)
+    _records_close(summary["best_hrv_hours"], [{"hour": h, "avg_rmssd": v} for h, v in expected_best.items()])
+    _records_close(summary["worst_hrv_hours"], [{"hour": h, "avg_rmssd": v} for h, v in expected_worst.items()])
+
+    names = analyzer.weekday_names
+    by_weekday = cells.groupby(level="weekday")
+    for key, idx in (("best_hours_per_weekday", by_weekday.idxmax()), ("worst_hours_per_weekday", by_weekday.idxmin())):
+        expected = {names[w]: {"hour": h, "avg_rmssd": cells.loc[(w, h)]} for w, (_, h) in idx.items()}
+        assert list(summary[key]) == list(expected)
+        for name, info in expected.items():
+            assert summary[key][name]["hour"] == info["hour"]
+            np.testing.assert_allclose(summary[key][name]["avg_rmssd"], info["avg_rmssd"], rtol=1e-9)
+
+    stress = weekday.sort_values("rmssd")
+    _records_close(summary["most_stressful_weekdays"], [
+        {"weekday": w, "weekday_name": names[w], "rmssd": r["rmssd"], "mean_hr": r["mean_hr"],
+         "lf_hf_ratio": r["lf_hf_ratio"], "stress_rank": rank}
+        for rank, (w, r) in enumerate(stress.iterrows(), start=1)
+    ])
+
+    labels = ["Hardest", "Hard", "Medium", "Easy", "Easiest"]
+    workweek = weekday[weekday.index < 5].sort_values("rmssd")
+    _records_close(summary["workweek_difficulty"], [
+        {"weekday": w, "weekday_name": names[w], "rmssd": r["rmssd"], "mean_hr": r["mean_hr"],
+         "sdnn": r["sdnn"], "difficulty_rank": rank, "difficulty_label": labels[rank - 1]}
+        for rank, (w, r) in enumerate(workweek.iterrows(), start=1)
+    ])
+
+
+def test_getters_match_weekly_summary(df_hrv):
+    analyzer = WeeklyAnalyzer()
+    summary = analyzer.create_weekly_summary(df_hrv)
+
+    _records_close(analyzer.get_hourly_patterns(df_hrv).to_dict("records"), summary["hourly_patterns"])
+    _records_close(analyzer.get_best_hrv_hours(df_hrv).to_dict("records"), summary["best_hrv_hours"])
+    _records_close(analyzer.get_worst_hrv_hours(df_hrv).to_dict("records"), summary["worst_hrv_hours"])
+    for got, key in (
+        (analyzer.get_best_hrv_hours_per_weekday(df_hrv), "best_hours_per_weekday"),
+        (analyzer.get_worst_hrv_hours_per_weekday(df_hrv), "worst_hours_per_weekday"),
+    ):
+        assert list(got) == list(summary[key])
+        _records_close(list(got.values()), list(summary[key].values()))
+    _records_close(analyzer.get_most_stressful_weekdays(df_hrv).to_dict("records"), summary["most_stressful_weekdays"])
+    _records_close(analyzer.get_workweek_difficulty(df_hrv).to_dict("records"), summary["workweek_difficulty"])
+
+
+def test_worst_hours_keep_hours_without_rmssd_last():
+    df = pd.DataFrame({
+        "timestamp": pd.date_range("2026-09-07", periods=4, freq="h", tz="UTC"),
+        "rmssd": [np.nan, 1.0, 2.0, 3.0],
+        "sdnn": 1.0,
+        "mean_hr": 60.0,
+        "lf_hf_ratio": 1.0,
+    })
+    worst = WeeklyAnalyzer().get_worst_hrv_hours(df)
+    assert worst["hour"].tolist() == [1, 2, 3, 0]
+    assert np.isnan(worst["avg_rmssd"].iloc[-1])
+
+
+def test_empty_frame_gives_empty_summary():
+    df = _hrv_frame().iloc[:0]
+    summary = WeeklyAnalyzer().create_weekly_summary(df)
+    assert all(len(value) == 0 for value in summary.values())
+
+
+def test_polars_backend_matches_pandas(df_hrv):
+    pytest.importorskip("polars")
+
+    pandas_summary = WeeklyAnalyzer().create_weekly_summary(df_hrv)
+    polars_analyzer = WeeklyAnalyzer(backend="polars")
+    polars_summary = polars_analyzer.create_weekly_summary(df_hrv)
+
+    assert polars_summary.keys() == pandas_summary.keys()
+    for key, expected in pandas_summary.items():
+        got = polars_summary[key]
+        if isinstance(expected, dict):
+            assert list(got) == list(expected)
+            got, expected = list(got.values()), list(expected.values())
+        _records_close(got, expected)
+
+    pandas_analyzer = WeeklyAnalyzer()
+    for getter in ("get_hourly_patterns", "get_best_hrv_hours", "get_worst_hrv_hours", "get_most_stressful_weekdays"):
+        _records_close(
+            getattr(polars_analyzer, getter)(df_hrv).to_dict("records"),
+            getattr(pandas_analyzer, getter)(df_hrv).to_dict("records"),
+        )
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        WeeklyAnalyzer(backend="spark")